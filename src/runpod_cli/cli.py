@@ -1,20 +1,37 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import inspect
+import json
 import logging
 import os
-import textwrap
+import random
+import stat
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import requests
 
-import boto3
-import fire
-import requests
-from dotenv import load_dotenv
+# Heavy third-party modules (runpod, boto3, requests, dotenv) are imported inside the functions that
+# need them, so that e.g. `rpc --help` does not pay for loading them.
 
 try:
     from .utils import (
+        DEFAULT_CLOUD_TYPE,
+        DEFAULT_GPU_TYPE,
         DEFAULT_IMAGE_NAME,
+        DEFAULT_RUNTIME_MINUTES,
+        DEFAULT_VOLUME_MOUNT_PATH,
         GPU_DISPLAY_NAME_TO_ID,
         GPU_ID_TO_DISPLAY_NAME,
+        POD_PORTS,
+        POD_PROFILES,
         get_setup_root,
         get_setup_user,
         get_start,
@@ -23,18 +40,33 @@ try:
 except ImportError:
     # Allow running cli.py directly from the repository
     from utils import (  # type: ignore
+        DEFAULT_CLOUD_TYPE,
+        DEFAULT_GPU_TYPE,
         DEFAULT_IMAGE_NAME,
+        DEFAULT_RUNTIME_MINUTES,
+        DEFAULT_VOLUME_MOUNT_PATH,
         GPU_DISPLAY_NAME_TO_ID,
         GPU_ID_TO_DISPLAY_NAME,
+        POD_PORTS,
+        POD_PROFILES,
         get_setup_root,
         get_setup_user,
         get_start,
         get_terminate,
     )
 
-logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(asctime)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+# Environment variables the CLI reads (see .env.example). If the required ones are set and the optional ones
+# are exported (possibly empty), loading a .env file could not change anything, so it is skipped.
+REQUIRED_ENV_VARS = ("RUNPOD_API_KEY", "RUNPOD_NETWORK_VOLUME_ID", "RUNPOD_S3_ACCESS_KEY_ID", "RUNPOD_S3_SECRET_KEY")
+OPTIONAL_ENV_VARS = ("GIT_NAME", "GIT_EMAIL")
+
+# Maximum number of concurrent S3 transfers or API requests
+MAX_WORKERS = 8
 
-import runpod  # noqa: E402
+# Seconds for which pod listings are served from the on-disk cache
+POD_CACHE_TTL = 10.0
+
+logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(asctime)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
 
 
 @dataclass
@@ -42,14 +74,14 @@ class PodSpec:
     """Specification for RunPod infrastructure parameters."""
 
     image_name: str = DEFAULT_IMAGE_NAME
-    gpu_type: str = "RTX A4000"
-    cloud_type: str = "SECURE"
+    gpu_type: str = DEFAULT_GPU_TYPE
+    cloud_type: str = DEFAULT_CLOUD_TYPE
     gpu_count: int = 1
     volume_in_gb: int = 10
     min_vcpu_count: int = 1
     min_memory_in_gb: int = 1
     container_disk_in_gb: int = 30
-    volume_mount_path: str = "/network"
+    volume_mount_path: str = DEFAULT_VOLUME_MOUNT_PATH
     runpodcli_dir: Optional[str] = None
     env: Optional[Dict[str, str]] = None
     update_ssh_config: bool = True
@@ -57,27 +89,100 @@ class PodSpec:
     update_known_hosts: bool = True
 
 
-def get_region_from_volume_id(volume_id: str) -> str:
+def get_region_from_volume_id(volume_id: str, session: Optional[requests.Session] = None) -> str:
+    import requests
+
     api_key = os.getenv("RUNPOD_API_KEY")
     url = f"https://rest.runpod.io/v1/networkvolumes/{volume_id}"
     headers = {"Authorization": f"Bearer {api_key}"}
-    response = requests.get(url, headers=headers)
+    response = (session or requests).get(url, headers=headers)
     if response.status_code != 200:
         raise ValueError(f"Failed to get volume info: {response.text}")
     volume_info = response.json()
     return volume_info.get("dataCenterId")
 
 
-def get_s3_endpoint_from_volume_id(volume_id: str) -> str:
-    data_center_id = get_region_from_volume_id(volume_id)
-    s3_endpoint = f"https://s3api-{data_center_id.lower()}.runpod.io/"
-    return s3_endpoint
+def get_s3_endpoint_from_region(data_center_id: str) -> str:
+    return f"https://s3api-{data_center_id.lower()}.runpod.io/"
+
+
+def get_cache_dir() -> str:
+    xdg_cache_dir = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(xdg_cache_dir, "runpod_cli")
+
+
+def read_json_file(path: str) -> Dict[str, Any]:
+    """Read a JSON cache file, returning an empty dict if it is missing, corrupt or not a JSON object."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def atomic_write_text(path: str, content: str, mode: int = 0o666) -> None:
+    """Write a file via a temporary file and os.replace, so concurrent readers never see a partial file.
+
+    Symlinks are resolved first so that the link target is updated rather than replaced by a regular file.
+    An existing file keeps its permission bits (restricted to mode); a new file is created with mode,
+    subject to the umask.
+    """
+    path = os.path.realpath(path)
+    try:
+        file_mode: Optional[int] = stat.S_IMODE(os.stat(path).st_mode) & mode
+    except FileNotFoundError:
+        file_mode = None
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    # O_EXCL so that a leftover or planted temporary file (or symlink) is never followed or truncated
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        with os.fdopen(fd, "w") as f:
+            if file_mode is not None:
+                os.chmod(tmp_path, file_mode)
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_json_file(path: str, data: Dict[str, Any]) -> None:
+    """Atomically write a JSON cache file that is readable only by the user."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write_text(path, json.dumps(data), mode=0o600)
+    except OSError as e:
+        logging.warning(f"Could not write cache file {path}: {e}")
+
+
+def summarize_pod(pod: Dict) -> Dict:
+    """Keep only the pod fields `rpc list` shows, dropping e.g. the container env and docker args."""
+    return {
+        "id": pod.get("id"),
+        "name": pod.get("name"),
+        "desiredStatus": pod.get("desiredStatus"),
+        "machine": {"gpuDisplayName": (pod.get("machine") or {}).get("gpuDisplayName")},
+        "runtime": {"ports": (pod.get("runtime") or {}).get("ports")},
+    }
+
+
+def get_public_port(pod: Dict) -> Optional[Dict]:
+    """Return the first publicly reachable port entry of a pod, or None if it has none."""
+    runtime = pod.get("runtime") or {}
+    return next((p for p in runtime.get("ports") or [] if p.get("isIpPublic")), None)
 
 
 class RunPodClient:
     """Pure logic client for RunPod and S3 operations without user I/O."""
 
     def __init__(self) -> None:
+        import requests
+        import runpod
+
         self.api_key = os.getenv("RUNPOD_API_KEY")
         if not self.api_key:
             raise ValueError("RUNPOD_API_KEY not found in environment. Set it in your .env file.")
@@ -93,26 +198,111 @@ class RunPodClient:
             raise ValueError("RUNPOD_S3_ACCESS_KEY_ID or RUNPOD_S3_SECRET_KEY not found in environment. Set it in your .env file.")
 
         runpod.api_key = self.api_key
-        self.region = get_region_from_volume_id(self.network_volume_id)
-        self.s3_endpoint = get_s3_endpoint_from_volume_id(self.network_volume_id)
+        api_key_hash = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:16]
+        self._cache_path = os.path.join(get_cache_dir(), f"api_{api_key_hash}.json")
+        # Keep-alive session for the volume lookup and readiness polling (get_pod), so repeated calls reuse one TLS connection
+        self._session = requests.Session()
+        self.region = self._get_volume_region()
+        self.s3_endpoint = get_s3_endpoint_from_region(self.region)
+        self._s3_client = None
+        self._s3_client_lock = threading.Lock()
+
+    def _get_volume_region(self) -> str:
+        """Look up the network volume's data center, persisting it locally since it never changes."""
+        volumes_path = os.path.join(get_cache_dir(), "volumes.json")
+        volume_regions = read_json_file(volumes_path)
+        region = volume_regions.get(self.network_volume_id)
+        if region is None:
+            region = get_region_from_volume_id(self.network_volume_id, session=self._session)
+            volume_regions[self.network_volume_id] = region
+            write_json_file(volumes_path, volume_regions)
+        return region
 
     def _make_s3_client(self):
-        return boto3.client(
-            "s3",
-            aws_access_key_id=self.s3_access_key_id,
-            aws_secret_access_key=self.s3_secret_key,
-            endpoint_url=self.s3_endpoint,
-            region_name=self.region,
-        )
-
-    def get_pods(self) -> List[Dict]:
-        return runpod.get_pods()  # type: ignore
+        # boto3 clients are thread-safe once created, so build one lazily (under a lock, since transfers
+        # run on worker threads) and share it across all transfers
+        if self._s3_client is None:
+            with self._s3_client_lock:
+                if self._s3_client is None:
+                    import boto3
+
+                    self._s3_client = boto3.client(
+                        "s3",
+                        aws_access_key_id=self.s3_access_key_id,
+                        aws_secret_access_key=self.s3_secret_key,
+                        endpoint_url=self.s3_endpoint,
+                        region_name=self.region,
+                    )
+        return self._s3_client
+
+    def _run_graphql_query(self, query: str) -> Dict:
+        """Run a GraphQL query against the RunPod API over the shared session."""
+        # Mirrors runpod.api.graphql.run_graphql_query, which opens a new connection on every call
+        from runpod import error as runpod_error
+        from runpod.user_agent import USER_AGENT
+
+        api_url_base = os.environ.get("RUNPOD_API_BASE_URL", "https://api.runpod.io")
+        headers = {"Content-Type": "application/json", "User-Agent": USER_AGENT, "Authorization": f"Bearer {self.api_key}"}
+        response = self._session.post(f"{api_url_base}/graphql", headers=headers, json={"query": query}, timeout=30)
+        if response.status_code == 401:
+            raise runpod_error.AuthenticationError("Unauthorized request, please check your API key.")
+        result = response.json()
+        if "errors" in result:
+            raise runpod_error.QueryError(result["errors"][0]["message"], query)
+        return result
+
+    def _cached(self, key: str, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Return fn() from the on-disk cache if it is younger than ttl seconds, else call it and cache the result."""
+        cache = read_json_file(self._cache_path)
+        entry = cache.get(key)
+        # Anything malformed (e.g. written by another version) is treated as a cache miss
+        if isinstance(entry, dict) and isinstance(entry.get("time"), (int, float)) and "value" in entry:
+            if time.time() - entry["time"] < ttl:
+                return entry["value"]
+        value = fn()
+        cache[key] = {"time": time.time(), "value": value}
+        write_json_file(self._cache_path, cache)
+        return value
+
+    def invalidate_cache(self) -> None:
+        try:
+            os.remove(self._cache_path)
+        except FileNotFoundError:
+            pass
+
+    def get_pods(self, ttl: float = POD_CACHE_TTL) -> List[Dict]:
+        """List pods, trimmed to the fields shown by `rpc list` so no secrets end up in the on-disk cache."""
+        import runpod
+
+        return self._cached("get_pods", ttl, lambda: [summarize_pod(pod) for pod in runpod.get_pods()])
 
     def get_pod(self, pod_id: str) -> Dict:
-        return runpod.get_pod(pod_id)
+        from runpod.api.queries import pods as pod_queries
+
+        return self._run_graphql_query(pod_queries.generate_pod_query(pod_id))["data"]["pod"]
 
     def terminate_pod(self, pod_id: str) -> Optional[Dict]:
-        return runpod.terminate_pod(pod_id)
+        import runpod
+
+        result = runpod.terminate_pod(pod_id)
+        self.invalidate_cache()
+        return result
+
+    def terminate_pods(self, pod_ids: List[str]) -> Dict[str, Optional[Exception]]:
+        """Terminate several pods concurrently, returning {pod ID: exception or None if it succeeded}."""
+        import runpod
+
+        def terminate(pod_id: str) -> Optional[Exception]:
+            try:
+                runpod.terminate_pod(pod_id)
+                return None
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            errors = list(executor.map(terminate, pod_ids))
+        self.invalidate_cache()
+        return dict(zip(pod_ids, errors))
 
     def upload_script_content(self, content: str, target: str) -> None:
         s3 = self._make_s3_client()
@@ -125,23 +315,41 @@ class RunPodClient:
 
     def _build_docker_args(self, volume_mount_path: str, runpodcli_dir: str, runtime: int) -> str:
         runpodcli_path = f"{volume_mount_path}/{runpodcli_dir}"
-        return (
-            "/bin/bash -c '"
-            + (f"mkdir -p {runpodcli_path}; bash {runpodcli_path}/start_pod.sh; sleep {max(runtime * 60, 20)}; bash {runpodcli_path}/terminate_pod.sh")
-            + "'"
-        )
-
-    def _provision_and_wait(self, pod_id: str, n_attempts: int = 60) -> Dict:
-        for i in range(n_attempts):
-            pod = runpod.get_pod(pod_id)
+        sleep_seconds = max(runtime * 60, 20)
+        commands = [
+            f"mkdir -p {runpodcli_path}",
+            f"bash {runpodcli_path}/start_pod.sh",
+            f"sleep {sleep_seconds}",
+            f"bash {runpodcli_path}/terminate_pod.sh",
+        ]
+        return "/bin/bash -c '" + "; ".join(commands) + "'"
+
+    def _wait_for_pod_ready(self, pod_id: str, timeout: float = 300.0, max_delay: float = 10.0) -> Dict:
+        """Poll until the pod exposes its runtime ports and return that final pod dict."""
+        # Poll with exponential backoff (1s, 1.5s, 2.25s, ... capped at max_delay) plus jitter,
+        # so fast-provisioning pods are detected early without hammering the API on slow ones.
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            pod = self.get_pod(pod_id)
             pod_runtime = pod.get("runtime")
-            if pod_runtime is None or not pod_runtime.get("ports"):
-                time.sleep(5)
-            else:
+            if pod_runtime is not None and pod_runtime.get("ports"):
                 return pod
-        raise RuntimeError("Pod provisioning failed")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError("Pod provisioning failed")
+            delay = min(max_delay, 1.5**attempt) + random.uniform(0, 0.5)
+            time.sleep(min(delay, remaining))
+            attempt += 1
 
     def create_pod(self, name: Optional[str], spec: PodSpec, runtime: int) -> Dict:
+        """Create a pod and wait for it to be provisioned.
+
+        Returns the pod dict from the last readiness poll, which already includes the runtime
+        ports, so callers should use it directly rather than fetching the pod again.
+        """
+        import runpod
+
         gpu_id = GPU_DISPLAY_NAME_TO_ID[spec.gpu_type] if spec.gpu_type in GPU_DISPLAY_NAME_TO_ID else spec.gpu_type
 
         name = name or f"{os.getenv('USER')}-{GPU_ID_TO_DISPLAY_NAME[gpu_id]}"
@@ -157,11 +365,15 @@ class RunPodClient:
             get_start(rpc_path),
             get_terminate(rpc_path),
         ]
-        for script_name, script_content in scripts:
-            self.upload_script_content(content=script_content, target=f"{spec.runpodcli_dir}/{script_name}")
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            uploads = [
+                executor.submit(self.upload_script_content, content=script_content, target=f"{spec.runpodcli_dir}/{script_name}")
+                for script_name, script_content in scripts
+            ]
+            for upload in uploads:
+                upload.result()
 
         docker_args = self._build_docker_args(volume_mount_path=spec.volume_mount_path, runpodcli_dir=spec.runpodcli_dir, runtime=runtime)
-        name = name or f"{os.getenv('USER')}-{GPU_ID_TO_DISPLAY_NAME[gpu_id]}"
 
         pod = runpod.create_pod(
             name=name,
@@ -175,36 +387,37 @@ class RunPodClient:
             min_memory_in_gb=spec.min_memory_in_gb,
             docker_args=docker_args,
             env=spec.env,
-            ports="8888/http,22/tcp",
+            ports=POD_PORTS,
             volume_mount_path=spec.volume_mount_path,
             network_volume_id=self.network_volume_id,
         )
 
+        self.invalidate_cache()
         pod_id: str = pod.get("id")  # type: ignore
-        pod = self._provision_and_wait(pod_id)
-
-        return pod
+        return self._wait_for_pod_ready(pod_id)
 
     def get_pod_public_ip_and_port(self, pod: Dict) -> Tuple[str, int]:
         """Extract public IP and port from pod runtime info."""
-        public_ips = [i for i in pod["runtime"]["ports"] if i["isIpPublic"]]
-        if len(public_ips) != 1:
-            raise ValueError(f"Expected 1 public IP, got {public_ips}")
-        ip = public_ips[0].get("ip")
-        port = public_ips[0].get("publicPort")
-        return ip, port
+        public_port = get_public_port(pod)
+        if public_port is None:
+            raise ValueError(f"No public IP found for pod {pod.get('id')}")
+        return public_port.get("ip"), public_port.get("publicPort")  # type: ignore
 
     def get_host_keys(self, remote_path: str) -> List[Tuple[str, str]]:
         """Download host keys from S3 and return list of (algorithm, key) pairs."""
-        host_keys = []
-        for file in ["ssh_ed25519_host_key", "ssh_ecdsa_host_key", "ssh_rsa_host_key", "ssh_dsa_host_key"]:
+
+        def download_host_key(file: str) -> Optional[Tuple[str, str]]:
             try:
                 host_key_text = self.download_file_content(f"{remote_path}/{file}").strip()
                 alg, key, _ = host_key_text.split(" ")
-                host_keys.append((alg, key))
+                return alg, key
             except Exception:
-                continue
-        return host_keys
+                return None
+
+        files = ["ssh_ed25519_host_key", "ssh_ecdsa_host_key", "ssh_rsa_host_key", "ssh_dsa_host_key"]
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            host_keys = list(executor.map(download_host_key, files))
+        return [host_key for host_key in host_keys if host_key is not None]
 
 
 class RunPodManager:
@@ -213,7 +426,7 @@ class RunPodManager:
     Available commands:
         create      Create a new pod with specified parameters
         list        List all pods in your account
-        terminate   Terminate a specific pod
+        terminate   Terminate one or more pods
 
     Global options:
         --env       Path to the .env file (optional). If not provided, will search for .env files in default locations.
@@ -233,14 +446,19 @@ class RunPodManager:
         """
         # Load environment variables
         if env:
+            from dotenv import load_dotenv
+
             logging.info(f"Using .env file: {env}")
             # Use the specified .env file
             env_path = os.path.expanduser(env)
             if not os.path.exists(env_path):
                 raise FileNotFoundError(f"Specified .env file not found: {env_path}")
             load_dotenv(override=True, dotenv_path=env_path)
-        else:
-            # Use default .env file search logic
+        elif not (all(os.getenv(var) for var in REQUIRED_ENV_VARS) and all(var in os.environ for var in OPTIONAL_ENV_VARS)):
+            from dotenv import load_dotenv
+
+            # Use default .env file search logic. Skipped entirely if every variable above is already exported;
+            # otherwise variables exported in the shell take precedence over the .env file.
             xdg_config_dir = os.environ.get("XDG_CONFIG_HOME", os.path.expanduser("~/.config"))
             env_paths = [".env", os.path.join(xdg_config_dir, "runpod_cli/.env")]
             env_exists = [os.path.exists(os.path.expanduser(path)) for path in env_paths]
@@ -248,35 +466,43 @@ class RunPodManager:
                 raise FileNotFoundError(f"No .env file found in {env_paths}")
             if env_exists.count(True) > 1:
                 raise FileExistsError(f"Multiple .env files found in {env_paths}")
-            load_dotenv(override=True, dotenv_path=os.path.expanduser(env_paths[env_exists.index(True)]))
+            load_dotenv(dotenv_path=os.path.expanduser(env_paths[env_exists.index(True)]))
 
         self._client = RunPodClient()
 
-    def list(self) -> None:
+    def list(self, no_cache: bool = False) -> None:
         """List all pods in your RunPod account.
 
         Displays information about each pod including ID, name, GPU type, status, and connection details.
+
+        Args:
+            no_cache: Always fetch a fresh listing instead of reusing one up to POD_CACHE_TTL seconds old
         """
-        pods = self._client.get_pods()
+        pods = self._client.get_pods(ttl=0 if no_cache else POD_CACHE_TTL)
 
+        # Build the whole listing first and write it in one go rather than one call per line
+        lines = []
         for i, pod in enumerate(pods):
-            logging.info(f"Pod {i + 1}:")
-            logging.info(f"  ID: {pod.get('id')}")
-            logging.info(f"  Name: {pod.get('name')}")
-            logging.info(f"  Machine Type: {pod.get('machine', {}).get('gpuDisplayName')}")
-            logging.info(f"  Status: {pod.get('desiredStatus')}")
-            public_ip = [i for i in pod.get("runtime", {}).get("ports", []) if i["isIpPublic"]]
-            if len(public_ip) != 1:
-                raise ValueError(f"Expected 1 public IP, got {len(public_ip)}")
-            logging.info(f"  Public IP: {public_ip[0].get('ip')}")
-            logging.info(f"  Public port: {public_ip[0].get('publicPort')}")
-            logging.info("")
+            # Pods that are stopped or still starting have no public port; list them anyway
+            public_port = get_public_port(pod) or {}
+            lines.append(
+                f"Pod {i + 1}:\n"
+                f"  ID: {pod.get('id')}\n"
+                f"  Name: {pod.get('name')}\n"
+                f"  Machine Type: {(pod.get('machine') or {}).get('gpuDisplayName')}\n"
+                f"  Status: {pod.get('desiredStatus')}\n"
+                f"  Public IP: {public_port.get('ip')}\n"
+                f"  Public port: {public_port.get('publicPort')}\n"
+            )
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
     def create(
         self,
         name: Optional[str] = None,
-        runtime: int = 60,
+        runtime: int = DEFAULT_RUNTIME_MINUTES,
         spec: Optional[PodSpec] = None,
+        profile: Optional[str] = None,
         gpu_type: Optional[str] = None,
         image_name: Optional[str] = None,
         cloud_type: Optional[str] = None,
@@ -294,28 +520,38 @@ class RunPodManager:
     ) -> None:
         """Create a new RunPod instance with the specified parameters.
 
+        Options left unset fall back to the PodSpec defaults.
+
         Args:
             name: Name for the pod (default: "$USER-$GPU_TYPE")
-            runtime: Time in minutes for pod to run (default: 60)
-            gpu_type: GPU type (default: "RTX A4000")
-            image_name: Docker image (default: PyTorch 2.8.0 with CUDA 12.8.1)
-            cloud_type: "SECURE" or "COMMUNITY" (default: "SECURE")
-            gpu_count: Number of GPUs (default: 1)
-            volume_in_gb: Ephemeral storage volume size in GB (default: 10)
-            min_vcpu_count: Minimum CPU count (default: 1)
-            min_memory_in_gb: Minimum RAM in GB (default: 1)
-            container_disk_in_gb: Container disk size in GB (default: 30)
-            volume_mount_path: Volume mount path (default: "/network")
+            runtime: Time in minutes for pod to run (default: DEFAULT_RUNTIME_MINUTES)
+            profile: Named preset from POD_PROFILES to start from; other options override it
+            gpu_type: GPU type
+            image_name: Docker image
+            cloud_type: "SECURE" or "COMMUNITY"
+            gpu_count: Number of GPUs
+            volume_in_gb: Ephemeral storage volume size in GB
+            min_vcpu_count: Minimum CPU count
+            min_memory_in_gb: Minimum RAM in GB
+            container_disk_in_gb: Container disk size in GB
+            volume_mount_path: Volume mount path
             runpodcli_dir: Directory name for runpodcli scripts (default: ".tmp_$name")
             env: Environment variables to set in the container
-            update_ssh_config: Whether to update SSH config (default: True)
-            forward_agent: Whether to forward SSH agent (default: False)
-            update_known_hosts: Whether to update known hosts (default: True)
+            update_ssh_config: Whether to update SSH config
+            forward_agent: Whether to forward SSH agent
+            update_known_hosts: Whether to update known hosts
 
         Examples:
             rpc create --gpu_type="A100 PCIe" --runtime=60
             rpc create --name="my-pod" --gpu_count=2 --runtime=240
+            rpc create --profile=a100 --runtime=120
         """
+        if profile is not None:
+            if spec is not None:
+                raise ValueError("Pass either spec or profile, not both")
+            if profile not in POD_PROFILES:
+                raise ValueError(f"Unknown profile {profile!r}, expected one of {', '.join(POD_PROFILES)}")
+            spec = PodSpec(**POD_PROFILES[profile])
         if spec is None:
             spec = PodSpec()
 
@@ -349,23 +585,26 @@ class RunPodManager:
         if update_known_hosts is not None:
             spec.update_known_hosts = update_known_hosts
 
-        logging.info("Creating pod with:")
-        logging.info(f"  Name: {name}")
-        logging.info(f"  Image: {spec.image_name}")
-        logging.info(f"  Network volume ID: {self._client.network_volume_id}")
-        logging.info(f"  Region: {self._client.region}")
-        logging.info(f"  S3 endpoint: {self._client.s3_endpoint}")
-        logging.info(f"  GPU Type: {spec.gpu_type}")
-        logging.info(f"  Cloud Type: {spec.cloud_type}")
-        logging.info(f"  GPU Count: {spec.gpu_count}")
-        logging.info(f"  runpodcli directory: {spec.runpodcli_dir}")
-        logging.info(f"  Time limit: {runtime} minutes")
-
-        logging.info("Pod created. Provisioning...")
+        # Emit the configuration as a single multi-line log record rather than one record per field
+        logging.info(
+            "Creating pod with:\n"
+            f"  Name: {name}\n"
+            f"  Image: {spec.image_name}\n"
+            f"  Network volume ID: {self._client.network_volume_id}\n"
+            f"  Region: {self._client.region}\n"
+            f"  S3 endpoint: {self._client.s3_endpoint}\n"
+            f"  GPU Type: {spec.gpu_type}\n"
+            f"  Cloud Type: {spec.cloud_type}\n"
+            f"  GPU Count: {spec.gpu_count}\n"
+            f"  runpodcli directory: {spec.runpodcli_dir}\n"
+            f"  Time limit: {runtime} minutes"
+        )
+
+        logging.info("Creating pod and waiting for it to be provisioned...")
         pod = self._client.create_pod(name, spec, runtime)
         logging.info("Pod provisioned.")
 
-        # Handle SSH config and known hosts
+        # Handle SSH config and known hosts, using the provisioned pod dict rather than re-fetching it
         ip, port = self._client.get_pod_public_ip_and_port(pod)
 
         if spec.update_ssh_config:
@@ -378,19 +617,23 @@ class RunPodManager:
             self._update_known_hosts_file(ip, port, spec.runpodcli_dir)
 
     def _generate_ssh_config(self, ip: str, port: int, forward_agent: bool = False) -> str:
-        return textwrap.dedent(f"""
-            Host runpod
-              HostName {ip}
-              User user
-              Port {port}
-              UserKnownHostsFile ~/.ssh/known_hosts ~/.ssh/known_hosts.runpod_cli
-              {"ForwardAgent yes" if forward_agent else ""}
-        """).strip()
+        forward = "\n  ForwardAgent yes" if forward_agent else ""
+        return (
+            f"Host runpod\n  HostName {ip}\n  User user\n  Port {port}\n"
+            f"  UserKnownHostsFile ~/.ssh/known_hosts ~/.ssh/known_hosts.runpod_cli{forward}"
+        )
 
     def _write_ssh_config(self, ip: str, port: int, forward_agent: bool, config_path: str = "~/.ssh/config.runpod_cli") -> None:
         runpod_config = self._generate_ssh_config(ip=ip, port=port, forward_agent=forward_agent)
-        with open(os.path.expanduser(config_path), "w") as f:
-            f.write(runpod_config)
+        path = os.path.expanduser(config_path)
+        try:
+            with open(path) as f:
+                if f.read() == runpod_config:
+                    logging.info(f"SSH config at {config_path} already up to date")
+                    return
+        except FileNotFoundError:
+            pass
+        atomic_write_text(path, runpod_config)
         logging.info(f"SSH config at {config_path} updated")
 
     def _update_known_hosts_file(self, public_ip: str, port: int, runpodcli_dir: str) -> None:
@@ -398,29 +641,151 @@ class RunPodManager:
         host_keys = self._client.get_host_keys(runpodcli_dir)
         known_hosts_path = os.path.expanduser("~/.ssh/known_hosts.runpod_cli")
 
-        for alg, key in host_keys:
-            try:
-                with open(known_hosts_path, "a") as dest:
-                    dest.write(f"# runpod cli:\n[{public_ip}]:{port} {alg} {key}\n")
-                logging.info(f"Added {alg} host key to {known_hosts_path}")
-            except Exception as e:
-                logging.error(f"Error adding host key: {e}")
+        if not host_keys:
+            return
+        entries = "".join(f"# runpod cli:\n[{public_ip}]:{port} {alg} {key}\n" for alg, key in host_keys)
+        try:
+            with open(known_hosts_path, "a") as dest:
+                dest.write(entries)
+            logging.info(f"Added {', '.join(alg for alg, _ in host_keys)} host keys to {known_hosts_path}")
+        except Exception as e:
+            logging.error(f"Error adding host keys: {e}")
 
-    def terminate(self, pod_id: str) -> None:
-        """Terminate a specific RunPod instance.
+    def terminate(self, pod_id: Optional[str] = None, pod_ids: Optional[str] = None) -> None:
+        """Terminate one or more RunPod instances.
 
         Args:
             pod_id: ID of the pod to terminate
+            pod_ids: Comma-separated IDs of pods to terminate concurrently
 
-        Example:
+        Examples:
+            rpc terminate abc123
             rpc terminate --pod_id=abc123
+            rpc terminate --pod_ids=abc123,def456
         """
-        logging.info(f"Terminating pod {pod_id}")
-        self._client.terminate_pod(pod_id)
+        ids = [pod_id] if pod_id else []
+        ids += [i.strip() for i in (pod_ids or "").split(",") if i.strip()]
+        if not ids:
+            raise ValueError("Specify --pod_id or --pod_ids")
+
+        if len(ids) == 1:
+            logging.info(f"Terminating pod {ids[0]}")
+            self._client.terminate_pod(ids[0])
+            return
+
+        logging.info(f"Terminating pods {', '.join(ids)}")
+        errors = self._client.terminate_pods(ids)
+        failed = {i: e for i, e in errors.items() if e is not None}
+        for i, e in failed.items():
+            logging.error(f"Error terminating pod {i}: {e}")
+        logging.info(f"Terminated {len(ids) - len(failed)} of {len(ids)} pods")
+        if failed:
+            raise RuntimeError(f"Failed to terminate pods: {', '.join(failed)}")
+
+
+def _str_to_bool(value: str) -> bool:
+    if value.lower() in ("true", "t", "yes", "y", "1"):
+        return True
+    if value.lower() in ("false", "f", "no", "n", "0"):
+        return False
+    raise argparse.ArgumentTypeError(f"Expected a boolean, got {value!r}")
+
+
+def _json_object(value: str) -> Dict[str, str]:
+    """Parse a JSON object of string keys to string values, e.g. for container environment variables."""
+    try:
+        data = json.loads(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Invalid JSON {value!r}: {e}")
+    if not isinstance(data, dict) or not all(isinstance(k, str) and isinstance(v, str) for k, v in data.items()):
+        raise argparse.ArgumentTypeError(f'Expected a JSON object of strings to strings, e.g. \'{{"KEY": "value"}}\', got {value!r}')
+    return data
+
+
+def _command_description(obj: Any) -> str:
+    """Return a cleaned docstring without the sections that argparse already lists as options."""
+    paragraphs = inspect.cleandoc(obj.__doc__ or "").split("\n\n")
+    return "\n\n".join(p for p in paragraphs if not p.startswith(("Args:", "Global options:")))
+
+
+def _add_command(subparsers: Any, name: str, method: Callable, parents: List[argparse.ArgumentParser]) -> argparse.ArgumentParser:
+    description = _command_description(method)
+    return subparsers.add_parser(
+        name,
+        help=description.splitlines()[0],
+        description=description,
+        parents=parents,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
 
+def build_parser() -> argparse.ArgumentParser:
+    """Build the `rpc` argument parser, with one subcommand per RunPodManager command."""
+    # Global options, accepted both before and after the subcommand (e.g. `rpc --env F list` and `rpc list --env F`).
+    # SUPPRESS keeps a subcommand's unset default from overwriting a value given before the subcommand.
+    global_options = argparse.ArgumentParser(add_help=False)
+    global_options.add_argument(
+        "--env",
+        dest="env_file",
+        metavar="ENV",
+        default=argparse.SUPPRESS,
+        help="Path to the .env file (optional). If not provided, will search for .env files in default locations.",
+    )
+    parents = [global_options]
+
+    parser = argparse.ArgumentParser(
+        prog="rpc", description=_command_description(RunPodManager), parents=parents, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command", required=True)
 
-def main():
-    fire.Fire(RunPodManager)
+    list_parser = _add_command(subparsers, "list", RunPodManager.list, parents)
+    list_parser.add_argument(
+        "--no_cache", action="store_true", help=f"Always fetch a fresh listing instead of reusing one up to {POD_CACHE_TTL:g} seconds old"
+    )
+
+    create = _add_command(subparsers, "create", RunPodManager.create, parents)
+    defaults = PodSpec()
+    create.add_argument("--name", help='Name for the pod (default: "$USER-$GPU_TYPE")')
+    create.add_argument(
+        "--runtime", type=int, default=DEFAULT_RUNTIME_MINUTES, help=f"Time in minutes for pod to run (default: {DEFAULT_RUNTIME_MINUTES})"
+    )
+    create.add_argument("--profile", choices=list(POD_PROFILES), help="Named preset to start from; other options override it")
+    create.add_argument("--gpu_type", help=f'GPU type (default: "{defaults.gpu_type}")')
+    create.add_argument("--image_name", help=f"Docker image (default: {defaults.image_name})")
+    create.add_argument("--cloud_type", help=f'"SECURE" or "COMMUNITY" (default: "{defaults.cloud_type}")')
+    create.add_argument("--gpu_count", type=int, help=f"Number of GPUs (default: {defaults.gpu_count})")
+    create.add_argument("--volume_in_gb", type=int, help=f"Ephemeral storage volume size in GB (default: {defaults.volume_in_gb})")
+    create.add_argument("--min_vcpu_count", type=int, help=f"Minimum CPU count (default: {defaults.min_vcpu_count})")
+    create.add_argument("--min_memory_in_gb", type=int, help=f"Minimum RAM in GB (default: {defaults.min_memory_in_gb})")
+    create.add_argument("--container_disk_in_gb", type=int, help=f"Container disk size in GB (default: {defaults.container_disk_in_gb})")
+    create.add_argument("--volume_mount_path", help=f'Volume mount path (default: "{defaults.volume_mount_path}")')
+    create.add_argument("--runpodcli_dir", help='Directory name for runpodcli scripts (default: ".tmp_$name")')
+    # Named --pod_env so it does not clash with the global --env option
+    create.add_argument(
+        "--pod_env", dest="env", type=_json_object, metavar="JSON", help="Environment variables to set in the container, as a JSON object"
+    )
+    for arg, help_text in (
+        ("update_ssh_config", f"Whether to update SSH config (default: {defaults.update_ssh_config})"),
+        ("forward_agent", f"Whether to forward SSH agent (default: {defaults.forward_agent})"),
+        ("update_known_hosts", f"Whether to update known hosts (default: {defaults.update_known_hosts})"),
+    ):
+        create.add_argument(f"--{arg}", type=_str_to_bool, nargs="?", const=True, metavar="BOOL", help=help_text)
+
+    terminate = _add_command(subparsers, "terminate", RunPodManager.terminate, parents)
+    # The pod ID may be given positionally (`rpc terminate POD_ID`) or as --pod_id; SUPPRESS stops the
+    # absent one from overwriting the other
+    terminate.add_argument("pod_id", nargs="?", metavar="POD_ID", default=argparse.SUPPRESS, help="ID of the pod to terminate")
+    terminate.add_argument("--pod_id", dest="pod_id", default=argparse.SUPPRESS, help="ID of the pod to terminate")
+    terminate.add_argument("--pod_ids", help="Comma-separated IDs of pods to terminate concurrently")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = vars(build_parser().parse_args(argv))
+    command = args.pop("command")
+    manager = RunPodManager(env=args.pop("env_file", None))
+    getattr(manager, command)(**args)
 
 
 if __name__ == "__main__":
@@ -4,6 +4,22 @@ from typing import Tuple
 # Default Docker image for pods
 DEFAULT_IMAGE_NAME = "runpod/pytorch:2.8.0-py3.11-cuda12.8.1-cudnn-devel-ubuntu22.04"
 
+# Default pod configuration
+DEFAULT_GPU_TYPE = "RTX A4000"
+DEFAULT_CLOUD_TYPE = "SECURE"
+DEFAULT_VOLUME_MOUNT_PATH = "/network"
+DEFAULT_RUNTIME_MINUTES = 60
+
+# Ports exposed by every pod (Jupyter over HTTP and SSH over TCP)
+POD_PORTS = "8888/http,22/tcp"
+
+# Named presets for `rpc create --profile`, as PodSpec field overrides. Explicit options still take precedence.
+POD_PROFILES = {
+    "dev": {"gpu_type": "A40"},
+    "a100": {"gpu_type": "A100 SXM", "container_disk_in_gb": 100},
+    "h100x8": {"gpu_type": "H100 SXM", "gpu_count": 8, "container_disk_in_gb": 200},
+}
+
 # GPU display name to ID mapping from https://docs.runpod.io/references/gpu-types
 GPU_DISPLAY_NAME_TO_ID = {
     "MI300X": "AMD Instinct MI300X OAM",